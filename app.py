@@ -1,10 +1,19 @@
-from fastapi import FastAPI, Request
+import hashlib
+
+from fastapi import FastAPI, Request, Response
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 
 app = FastAPI()
 templates = Jinja2Templates(directory="templates")
 
+# landing.html has no per-request state, so render it once at import time
+LANDING_HTML = templates.get_template("landing.html").render()
+LANDING_ETAG = '"%s"' % hashlib.md5(LANDING_HTML.encode()).hexdigest()
+
 @app.get("/", response_class=HTMLResponse)
-def landing(request: Request):
-    return templates.TemplateResponse("landing.html", {"request": request})
+async def landing(request: Request):
+    headers = {"ETag": LANDING_ETAG, "Cache-Control": "no-cache"}
+    if LANDING_ETAG in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(LANDING_HTML, headers=headers)